@@ -13,8 +13,9 @@
 # - This file is intentionally written as a "hard-coded" sequential workflow.
 # - No user-defined functions.
 # - No conditional statements (no if/else).
-# - You will see the same steps repeated for each professor so students can
-#   follow the logic and edit one piece at a time.
+# - Steps that are the same for every professor are written once inside a
+#   for loop (or list comprehension) over the four professors, so students
+#   can follow the logic and edit one piece at a time.
 ###############################################################################
 
 # -----------------------------------------------------------------------------
@@ -23,16 +24,51 @@
 # Install (if needed) and load the necessary libraries.
 #
 # If you do not have these installed, run (in Terminal / Anaconda Prompt):
-#   pip install requests lxml pandas matplotlib scholarly
+#   pip install requests requests-cache lxml pandas matplotlib scholarly
 
 import re
-import requests
+import shelve
+import requests_cache
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from lxml import html
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
 from scholarly import scholarly
+from urllib3.util.retry import Retry
+
+
+# -----------------------------------------------------------------------------
+# Shared HTTP session
+# -----------------------------------------------------------------------------
+# A basic browser-like header can reduce the chance of being blocked.
+# (requests already asks servers for compressed pages and to keep the
+# connection open, so we do not need to add those headers ourselves.)
+headers = {"User-Agent": "Mozilla/5.0 (Teaching Script)"}
+
+# One shared session for every page request (Wikipedia and PSU):
+# - the header is set once instead of on every call
+# - open connections are kept and reused (the two polisci pages and the two
+#   sociology pages share a host, so the second request skips the handshake)
+# - transient failures are retried a few times with a short backoff
+# - responses are saved to a local cache file (scrape_cache.sqlite) for one
+#   day, so re-running the script reads the pages from disk instead of the web
+session = requests_cache.CachedSession(
+    "scrape_cache",
+    backend="sqlite",
+    expire_after=24 * 3600
+)
+session.headers.update(headers)
+
+adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+session.mount("http://", adapter)
+session.mount("https://", adapter)
 
 
 # -----------------------------------------------------------------------------
@@ -68,24 +104,46 @@ from scholarly import scholarly
 # URL of the Wikipedia page
 wiki_url = "https://en.wikipedia.org/wiki/Thomas_Brunell"
 
-# Read all HTML tables that match the "infobox" class
-wiki_tables = pd.read_html(wiki_url, attrs={"class": "infobox"})
-
-
-# Take the first infobox table on the page
-wiki_table = wiki_tables[0]
-
-# Give the columns simple names (X1, X2, ...) so we can clean consistently
-wiki_table.columns = [f"X{i+1}" for i in range(wiki_table.shape[1])]
-
-# Clean the data:
-# - Keep only rows where both X1 and X2 exist (not missing)
-# - Rename X1 -> Key and X2 -> Value
-cleaned_data = (
-    wiki_table
-    .dropna(subset=["X1", "X2"])
-    .rename(columns={"X1": "Key", "X2": "Value"})[["Key", "Value"]]
-    .reset_index(drop=True)
+# Request the page HTML (through the shared session) and parse it with lxml.
+# .content is the raw bytes of the page; lxml reads the character encoding
+# from the page itself, so we skip decoding it to a Python string first.
+wiki_tree = html.fromstring(session.get(wiki_url).content)
+
+# Take the rows of the first infobox table on the page
+wiki_rows = wiki_tree.xpath("(//table[contains(@class,'infobox')])[1]//tr")
+
+# Line breaks (<br>) separate lines inside a cell; put a newline in their
+# place so the lines do not run together when we join the cell's text.
+for br in wiki_tree.iter("br"):
+    br.tail = "\n" + (br.tail or "")
+
+# Each row has a label cell (<th>) and a value cell (<td>). We keep only the
+# text a reader would see, skipping:
+# - pieces hidden with "display:none" (extra machine-readable copies of
+#   dates and names)
+# - CSS inside <style> tags (Wikipedia puts some styles inside table cells)
+visible_text = (
+    "//text()"
+    "[not(ancestor::*[contains(translate(@style,' ',''),'display:none')])"
+    " and not(ancestor::style)]"
+)
+wiki_key_xp = etree.XPath("th" + visible_text)
+wiki_value_xp = etree.XPath("td" + visible_text)
+
+# For each row, glue the visible pieces together, then reduce every run of
+# whitespace (including the newlines from <br>) to one space.
+wiki_pairs = []
+for r in wiki_rows:
+    key = " ".join("".join(wiki_key_xp(r)).split())
+    value = " ".join("".join(wiki_value_xp(r)).split())
+    wiki_pairs.append((key, value))
+
+# Clean the data in one step:
+# - Keep only rows where both Key and Value exist (not empty)
+# - Name the two columns Key and Value
+cleaned_data = pd.DataFrame(
+    [(k, v) for k, v in wiki_pairs if k and v],
+    columns=["Key", "Value"]
 )
 
 # At this point, cleaned_data is a simple Key/Value table.
@@ -97,7 +155,7 @@ cleaned_data = (
 # Part 1B: Hard-code four Penn State faculty (social sciences broadly)
 # -----------------------------------------------------------------------------
 # These are the four faculty members we will use throughout the script.
-# (We will repeat the same scraping steps for each person.)
+# (We will run the same scraping steps for each person.)
 
 matt_name = "Matt Golder"
 matt_dept = "Political Science (College of the Liberal Arts)"
@@ -115,192 +173,128 @@ jeremy_name = "Jeremy Staff"
 jeremy_dept = "Sociology & Criminology (College of the Liberal Arts)"
 jeremy_url  = "https://sociology.la.psu.edu/people/jeremy-staff/"
 
-# A basic browser-like header can reduce the chance of being blocked.
-headers = {"User-Agent": "Mozilla/5.0 (Teaching Script)"}
+# Collect the four faculty members in one list so the scraping steps below
+# are written once and then run for each person in turn.
+faculty = [
+    {"name": matt_name,   "dept": matt_dept,   "url": matt_url},
+    {"name": sona_name,   "dept": sona_dept,   "url": sona_url},
+    {"name": derek_name,  "dept": derek_dept,  "url": derek_url},
+    {"name": jeremy_name, "dept": jeremy_dept, "url": jeremy_url},
+]
 
 # -----------------------------------------------------------------------------
-# Step 1: Scrape Matt Golder (one complete example, step-by-step)
+# Step 1: Download all four profile pages at once
 # -----------------------------------------------------------------------------
-# 1) Request the PSU profile page HTML
-matt_html = requests.get(matt_url, headers=headers).text
+# The four requests do not depend on each other, so instead of waiting for
+# each page in turn we send them together from a small pool of threads.
+# The total wait is roughly the slowest single page, not the sum of all four.
+# ex.map returns the responses in the same order as the URLs we pass in,
+# so we can pair each page back up with its URL. As with Wikipedia, we keep
+# the raw bytes (.content) and let lxml handle the decoding.
+urls = [f["url"] for f in faculty]
 
-# 2) Parse the HTML with lxml so we can use XPath (like we did in R)
-matt_tree = html.fromstring(matt_html)
+with ThreadPoolExecutor(max_workers=4) as ex:
+    htmls = dict(zip(urls, [r.content for r in ex.map(session.get, urls)]))
 
-# 3) Pull the full page text (useful for regex extraction)
-matt_text = " ".join(matt_tree.xpath("//body//text()"))
-matt_text = re.sub(r"\s+", " ", matt_text).strip()
+# -----------------------------------------------------------------------------
+# Step 2: Scrape each faculty page (same steps for every person)
+# -----------------------------------------------------------------------------
+# Regex patterns are compiled once here and reused for every page,
+# instead of being looked up / recompiled on each call inside the loop.
 
-# 4) Extract a job title line (regex)
-title_pattern = (
+# Regex for a job title line
+title_re = re.compile(
     r"(?:Distinguished|Liberal Arts|Roy C\.|Arnold S\.|James P\.)?"
     r"\s*(?:Associate\s+)?Professor[^\n\r]{0,120}"
 )
-matt_title = " ".join(re.findall(title_pattern, matt_text)[:1]).strip()
-
-# 5) Extract a PSU email address (regex)
-email_pattern = r"[A-Za-z0-9._%+-]+@psu\.edu"
-matt_email = " ".join(re.findall(email_pattern, matt_text)[:1]).strip()
-
-# 6) Extract "Areas of Interest" (XPath)
-matt_areas = matt_tree.xpath(
-    "//h2[normalize-space()='Areas of Interest']/following-sibling::ul[1]/li//text()"
-)
-matt_areas = list(filter(None, map(str.strip, matt_areas)))
-
-# 7) Extract "Research Interests" (XPath)
-matt_research = matt_tree.xpath(
-    "//h2[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
-    " | //h3[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
-)
-matt_research = list(filter(None, map(str.strip, matt_research)))
 
-# 8) Combine whatever we found into one string (semicolon-separated)
-matt_interests_list = matt_areas + matt_research
-matt_interests = "; ".join(matt_interests_list)
+# Regex for a PSU email address
+email_re = re.compile(r"[A-Za-z0-9._%+-]+@psu\.edu")
 
-# 9) Count how many interest items we captured
-matt_n_interest_items = len(matt_interests_list)
+# An HTML parser that drops whitespace-only text and HTML comments while it
+# reads the page, so each tree is smaller and quicker to search.
+html_parser = html.HTMLParser(remove_blank_text=True, remove_comments=True)
 
-# 10) Store results as one row (DataFrame)
-matt_row = pd.DataFrame([{
-    "name": matt_name,
-    "department": matt_dept,
-    "url": matt_url,
-    "scraped_title": matt_title,
-    "scraped_email": matt_email,
-    "scraped_interests": matt_interests,
-    "n_interest_items": matt_n_interest_items
-}])
+# XPath queries are compiled once as well; calling a compiled query on a tree
+# skips re-parsing the XPath string for every page.
 
-
-# -----------------------------------------------------------------------------
-# Step 2: Scrape Sona N. Golder (repeat the same workflow)
-# -----------------------------------------------------------------------------
-sona_html = requests.get(sona_url, headers=headers).text
-sona_tree = html.fromstring(sona_html)
-
-sona_text = " ".join(sona_tree.xpath("//body//text()"))
-sona_text = re.sub(r"\s+", " ", sona_text).strip()
-
-sona_title = " ".join(re.findall(title_pattern, sona_text)[:1]).strip()
-sona_email = " ".join(re.findall(email_pattern, sona_text)[:1]).strip()
-
-sona_areas = sona_tree.xpath(
-    "//h2[normalize-space()='Areas of Interest']/following-sibling::ul[1]/li//text()"
+# Text from the parts of the page that often hold the title and email
+# (the page header and the profile / field blocks). The regexes try this
+# small slice of the page first.
+profile_text_xp = etree.XPath(
+    "//*[self::header or contains(@class,'profile') or contains(@class,'field')]//text()"
 )
-sona_areas = list(filter(None, map(str.strip, sona_areas)))
 
-sona_research = sona_tree.xpath(
-    "//h2[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
-    " | //h3[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
-)
-sona_research = list(filter(None, map(str.strip, sona_research)))
-
-sona_interests_list = sona_areas + sona_research
-sona_interests = "; ".join(sona_interests_list)
-sona_n_interest_items = len(sona_interests_list)
-
-sona_row = pd.DataFrame([{
-    "name": sona_name,
-    "department": sona_dept,
-    "url": sona_url,
-    "scraped_title": sona_title,
-    "scraped_email": sona_email,
-    "scraped_interests": sona_interests,
-    "n_interest_items": sona_n_interest_items
-}])
-
-
-# -----------------------------------------------------------------------------
-# Step 3: Scrape Derek Kreager (repeat the same workflow)
-# -----------------------------------------------------------------------------
-derek_html = requests.get(derek_url, headers=headers).text
-derek_tree = html.fromstring(derek_html)
-
-derek_text = " ".join(derek_tree.xpath("//body//text()"))
-derek_text = re.sub(r"\s+", " ", derek_text).strip()
-
-derek_title = " ".join(re.findall(title_pattern, derek_text)[:1]).strip()
-derek_email = " ".join(re.findall(email_pattern, derek_text)[:1]).strip()
+# All text inside <body> (searched when the slice above lacks a title or email)
+body_text_xp = etree.XPath("//body//text()")
 
-derek_areas = derek_tree.xpath(
+# "Areas of Interest" list items
+areas_xp = etree.XPath(
     "//h2[normalize-space()='Areas of Interest']/following-sibling::ul[1]/li//text()"
 )
-derek_areas = list(filter(None, map(str.strip, derek_areas)))
 
-derek_research = derek_tree.xpath(
+# "Research Interests" (listed under an h2 on some pages and an h3 on others)
+research_xp = etree.XPath(
     "//h2[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
     " | //h3[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
 )
-derek_research = list(filter(None, map(str.strip, derek_research)))
 
-derek_interests_list = derek_areas + derek_research
-derek_interests = "; ".join(derek_interests_list)
-derek_n_interest_items = len(derek_interests_list)
+# Each pass through the loop adds one dictionary (one row) to this list.
+rows = []
 
-derek_row = pd.DataFrame([{
-    "name": derek_name,
-    "department": derek_dept,
-    "url": derek_url,
-    "scraped_title": derek_title,
-    "scraped_email": derek_email,
-    "scraped_interests": derek_interests,
-    "n_interest_items": derek_n_interest_items
-}])
+for f in faculty:
+    # 1) Parse the downloaded HTML with lxml so we can use XPath (like we did in R)
+    tree = html.fromstring(htmls[f["url"]], parser=html_parser)
 
+    # 2) Pull the text to search with regex (useful for regex extraction)
+    #    str.split() breaks each piece of text on any run of whitespace, so
+    #    joining the words back with single spaces also tidies the spacing.
+    #    We start with the small profile slice. If it has both a title and an
+    #    email we search just that slice; otherwise `or` moves on and builds
+    #    the full page text instead (it is only built when it is needed).
+    profile_text = " ".join(w for t in profile_text_xp(tree) for w in t.split())
+    text = (
+        (title_re.search(profile_text) and email_re.search(profile_text) and profile_text)
+        or " ".join(w for t in body_text_xp(tree) for w in t.split())
+    )
 
-# -----------------------------------------------------------------------------
-# Step 4: Scrape Jeremy Staff (repeat the same workflow)
-# -----------------------------------------------------------------------------
-jeremy_html = requests.get(jeremy_url, headers=headers).text
-jeremy_tree = html.fromstring(jeremy_html)
-
-jeremy_text = " ".join(jeremy_tree.xpath("//body//text()"))
-jeremy_text = re.sub(r"\s+", " ", jeremy_text).strip()
+    # 3) Extract a job title line and a PSU email address (regex)
+    title = " ".join(title_re.findall(text)[:1]).strip()
+    email = " ".join(email_re.findall(text)[:1]).strip()
 
-jeremy_title = " ".join(re.findall(title_pattern, jeremy_text)[:1]).strip()
-jeremy_email = " ".join(re.findall(email_pattern, jeremy_text)[:1]).strip()
+    # 4) Extract "Areas of Interest" (XPath)
+    areas = areas_xp(tree)
+    areas = list(filter(None, map(str.strip, areas)))
 
-jeremy_areas = jeremy_tree.xpath(
-    "//h2[normalize-space()='Areas of Interest']/following-sibling::ul[1]/li//text()"
-)
-jeremy_areas = list(filter(None, map(str.strip, jeremy_areas)))
-
-jeremy_research = jeremy_tree.xpath(
-    "//h2[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
-    " | //h3[normalize-space()='Research Interests']/following-sibling::*[1]//text()"
-)
-jeremy_research = list(filter(None, map(str.strip, jeremy_research)))
+    # 5) Extract "Research Interests" (XPath)
+    research = research_xp(tree)
+    research = list(filter(None, map(str.strip, research)))
 
-jeremy_interests_list = jeremy_areas + jeremy_research
-jeremy_interests = "; ".join(jeremy_interests_list)
-jeremy_n_interest_items = len(jeremy_interests_list)
+    # 6) Combine whatever we found into one string (semicolon-separated)
+    interests_list = areas + research
 
-jeremy_row = pd.DataFrame([{
-    "name": jeremy_name,
-    "department": jeremy_dept,
-    "url": jeremy_url,
-    "scraped_title": jeremy_title,
-    "scraped_email": jeremy_email,
-    "scraped_interests": jeremy_interests,
-    "n_interest_items": jeremy_n_interest_items
-}])
+    # 7) Store results as one row
+    rows.append({
+        "name": f["name"],
+        "department": f["dept"],
+        "url": f["url"],
+        "scraped_title": title,
+        "scraped_email": email,
+        "scraped_interests": "; ".join(interests_list),
+        "n_interest_items": len(interests_list)
+    })
 
 
 # -----------------------------------------------------------------------------
-# Step 5: Combine the scraped rows into one data frame and inspect
+# Step 3: Build one data frame from the scraped rows and inspect
 # -----------------------------------------------------------------------------
-scraped_profiles = pd.concat(
-    [matt_row, sona_row, derek_row, jeremy_row],
-    ignore_index=True
-)
+scraped_profiles = pd.DataFrame(rows)
 
 print(scraped_profiles)
 
 
 # -----------------------------------------------------------------------------
-# Step 6: Quick plot (interest items captured per faculty member)
+# Step 4: Quick plot (interest items captured per faculty member)
 # -----------------------------------------------------------------------------
 # This mirrors the bar chart from the R version.
 
@@ -341,64 +335,64 @@ jeremy_scholar_id = "nm4ZRCgAAAAJ"
 
 
 # -----------------------------------------------------------------------------
-# Step 2: Pull Google Scholar profiles (sequentially)
+# Step 2: Pull Google Scholar profiles (four at a time)
 # -----------------------------------------------------------------------------
-matt_author = scholarly.search_author_id(matt_scholar_id)
-matt_author = scholarly.fill(matt_author, sections=["basics", "indices", "counts", "publications"])
-
-sona_author = scholarly.search_author_id(sona_scholar_id)
-sona_author = scholarly.fill(sona_author, sections=["basics", "indices", "counts", "publications"])
-
-derek_author = scholarly.search_author_id(derek_scholar_id)
-derek_author = scholarly.fill(derek_author, sections=["basics", "indices", "counts", "publications"])
-
-jeremy_author = scholarly.search_author_id(jeremy_scholar_id)
-jeremy_author = scholarly.fill(jeremy_author, sections=["basics", "indices", "counts", "publications"])
+# Each profile takes many separate requests to Google Scholar, and the four
+# professors do not depend on each other, so we run them side by side in a
+# small pool of threads.
+#   (1) search_author_id finds each author record
+#   (2) fill downloads the sections we need for each author
+#
+# Filled profiles are saved on disk (scholar_cache) under their Scholar ID
+# plus today's date, e.g. "yPbxmSwAAAAJ:2026-10-15". Re-running the script on
+# the same day reads the saved profiles instead of asking Scholar again, which
+# keeps the script fast and avoids Scholar's bot checks. On a new day the keys
+# change, so the profiles are downloaded fresh (one-day lifetime, like the
+# page cache above). Older days stay in the file until you delete it.
+scholar_ids = [matt_scholar_id, sona_scholar_id, derek_scholar_id, jeremy_scholar_id]
+scholar_sections = ["basics", "indices", "counts", "publications"]
+
+# Today's cache key for each Scholar ID
+cache_keys = {f"{sid}:{date.today()}": sid for sid in scholar_ids}
+
+with shelve.open("scholar_cache") as scholar_cache:
+    # Keys we have not saved yet (set difference: all keys minus saved keys)
+    missing_keys = sorted(set(cache_keys) - set(scholar_cache))
+
+    # ex.map keeps the results in the same order as missing_keys, so we can
+    # pair each filled profile back up with its key and save it.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        authors = list(ex.map(
+            scholarly.search_author_id, [cache_keys[k] for k in missing_keys]
+        ))
+        scholar_cache.update(zip(
+            missing_keys,
+            ex.map(scholarly.fill, authors, [scholar_sections] * len(authors))
+        ))
+
+    matt_author, sona_author, derek_author, jeremy_author = [
+        scholar_cache[k] for k in cache_keys
+    ]
+
+# Match each professor's name to their filled Google Scholar record
+scholar_authors = {
+    matt_name: matt_author,
+    sona_name: sona_author,
+    derek_name: derek_author,
+    jeremy_name: jeremy_author,
+}
 
 
 print("\n------------------------------")
 print("Google Scholar Profile Summaries")
 print("------------------------------")
 
-matt_profile = pd.DataFrame([{
-    "name": matt_author.get("name", ""),
-    "affiliation": matt_author.get("affiliation", ""),
-    "citedby": matt_author.get("citedby", ""),
-    "hindex": matt_author.get("hindex", ""),
-    "i10index": matt_author.get("i10index", "")
-}])
-print("\n" + matt_name)
-print(matt_profile)
-
-sona_profile = pd.DataFrame([{
-    "name": sona_author.get("name", ""),
-    "affiliation": sona_author.get("affiliation", ""),
-    "citedby": sona_author.get("citedby", ""),
-    "hindex": sona_author.get("hindex", ""),
-    "i10index": sona_author.get("i10index", "")
-}])
-print("\n" + sona_name)
-print(sona_profile)
-
-derek_profile = pd.DataFrame([{
-    "name": derek_author.get("name", ""),
-    "affiliation": derek_author.get("affiliation", ""),
-    "citedby": derek_author.get("citedby", ""),
-    "hindex": derek_author.get("hindex", ""),
-    "i10index": derek_author.get("i10index", "")
-}])
-print("\n" + derek_name)
-print(derek_profile)
-
-jeremy_profile = pd.DataFrame([{
-    "name": jeremy_author.get("name", ""),
-    "affiliation": jeremy_author.get("affiliation", ""),
-    "citedby": jeremy_author.get("citedby", ""),
-    "hindex": jeremy_author.get("hindex", ""),
-    "i10index": jeremy_author.get("i10index", "")
-}])
-print("\n" + jeremy_name)
-print(jeremy_profile)
+# Collect one summary dictionary per professor, then print a single table.
+profiles = [
+    {k: author.get(k, "") for k in ("name", "affiliation", "citedby", "hindex", "i10index")}
+    for author in scholar_authors.values()
+]
+print(pd.DataFrame(profiles))
 
 
 # -----------------------------------------------------------------------------
@@ -411,21 +405,16 @@ print("\n------------------------------")
 print("Recent Publications (first 5)")
 print("------------------------------")
 
-matt_pubs_df = pd.json_normalize(matt_author["publications"][:5])
-print("\n" + matt_name)
-print(matt_pubs_df[["bib.title", "bib.year"]].head(5))
-
-sona_pubs_df = pd.json_normalize(sona_author["publications"][:5])
-print("\n" + sona_name)
-print(sona_pubs_df[["bib.title", "bib.year"]].head(5))
-
-derek_pubs_df = pd.json_normalize(derek_author["publications"][:5])
-print("\n" + derek_name)
-print(derek_pubs_df[["bib.title", "bib.year"]].head(5))
-
-jeremy_pubs_df = pd.json_normalize(jeremy_author["publications"][:5])
-print("\n" + jeremy_name)
-print(jeremy_pubs_df[["bib.title", "bib.year"]].head(5))
+# We only need each publication's title and year, so we pick those two
+# fields out of the "bib" dictionary instead of flattening every field.
+# (scholarly stores the year under the key "pub_year".)
+for name, author in scholar_authors.items():
+    pubs_df = pd.DataFrame([
+        {"title": pub["bib"].get("title"), "year": pub["bib"].get("pub_year")}
+        for pub in author["publications"][:5]
+    ])
+    print("\n" + name)
+    print(pubs_df)
 
 
 # -----------------------------------------------------------------------------
@@ -434,23 +423,21 @@ print(jeremy_pubs_df[["bib.title", "bib.year"]].head(5))
 # scholarly stores citation history in author["cites_per_year"] as a dictionary:
 #   {year: citations, year: citations, ...}
 
-matt_ct = pd.DataFrame(list(matt_author["cites_per_year"].items()), columns=["year", "cites"])
-matt_ct["name"] = matt_name
-matt_ct = matt_ct.sort_values("year")
-
-sona_ct = pd.DataFrame(list(sona_author["cites_per_year"].items()), columns=["year", "cites"])
-sona_ct["name"] = sona_name
-sona_ct = sona_ct.sort_values("year")
-
-derek_ct = pd.DataFrame(list(derek_author["cites_per_year"].items()), columns=["year", "cites"])
-derek_ct["name"] = derek_name
-derek_ct = derek_ct.sort_values("year")
-
-jeremy_ct = pd.DataFrame(list(jeremy_author["cites_per_year"].items()), columns=["year", "cites"])
-jeremy_ct["name"] = jeremy_name
-jeremy_ct = jeremy_ct.sort_values("year")
-
-citation_df = pd.concat([matt_ct, sona_ct, derek_ct, jeremy_ct], ignore_index=True)
+# Match each professor's name to their citation dictionary
+cites_by_author = {
+    name: author["cites_per_year"] for name, author in scholar_authors.items()
+}
+
+# Build every (year, cites, name) row in one pass and make a single data frame.
+# sorted() puts each professor's years in order before the frame is created.
+citation_df = pd.DataFrame(
+    [
+        (year, cites, name)
+        for name, cites_per_year in cites_by_author.items()
+        for year, cites in sorted(cites_per_year.items())
+    ],
+    columns=["year", "cites", "name"]
+)
 
 print("\nCombined citation data (first 10 rows):")
 print(citation_df.head(10))
@@ -461,16 +448,19 @@ print(citation_df.head(10))
 # -----------------------------------------------------------------------------
 # This mirrors the multi-line ggplot from the R version.
 
-plt.figure()
-plt.plot(matt_ct["year"], matt_ct["cites"], marker="o", label=matt_name)
-plt.plot(sona_ct["year"], sona_ct["cites"], marker="o", label=sona_name)
-plt.plot(derek_ct["year"], derek_ct["cites"], marker="o", label=derek_name)
-plt.plot(jeremy_ct["year"], jeremy_ct["cites"], marker="o", label=jeremy_name)
-
-plt.title("Google Scholar Citation History (Recent Years)")
-plt.xlabel("Year")
-plt.ylabel("Citations")
-plt.legend()
+# citation_df is already one row per professor-year, sorted by year within
+# each professor. Grouping by name draws one line per professor with a
+# single plot call; sort=False keeps the professors (and the legend) in the
+# order above. Each line only uses that professor's own years, so a year
+# Scholar left out (zero citations) does not break the line.
+fig, ax = plt.subplots()
+citation_df.set_index("year").groupby("name", sort=False)["cites"].plot(
+    ax=ax, marker="o", legend=True
+)
+
+ax.set_title("Google Scholar Citation History (Recent Years)")
+ax.set_xlabel("Year")
+ax.set_ylabel("Citations")
 plt.tight_layout()
 plt.show()
 
@@ -478,12 +468,9 @@ plt.show()
 # -----------------------------------------------------------------------------
 # Step 6: Median citations per year for each professor
 # -----------------------------------------------------------------------------
-median_cites = (
-    citation_df
-    .groupby("name", as_index=False)["cites"]
-    .median()
-    .rename(columns={"cites": "median_cites"})
-)
+# The result is a Series indexed by professor name, which prints as a
+# simple two-column listing.
+median_cites = citation_df.groupby("name")["cites"].median().rename("median_cites")
 
 print("\nMedian citations per year (by faculty):")
 print(median_cites)